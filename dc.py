@@ -19,13 +19,19 @@
 # ========================================================================
 
 import argparse
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+import csv
+from functools import lru_cache
+import heapq
 import re
+import sys
 
 # https://matplotlib.org/stable/users/getting_started/
 # Note that I had to upgrade pyparsing on my PC in order for matplotlib to install: pip install pyparsing==2.4.7
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+import matplotlib.collections as collections
+from matplotlib.font_manager import FontProperties
 import numpy as np # added for drawing triangles
 
 # ========================================================================
@@ -39,20 +45,31 @@ FIELD_HEADER = "....'....|....'....|....'....|....'....|....'....|....'....|....
 FIELD_HEADER_WIDTH = len(FIELD_HEADER)
 YDMRK_HEADER = "        1 0       2 0       3 0       4 0       5 0       4 0       3 0       2 0       1 0        "
 
-def get_header_field_string(r_abbrev,h_abbrev):
-    field="%s%s%s%s" % (DC_PREFIX,h_abbrev,FIELD_HEADER,r_abbrev)
+# Everything the text drive chart needs to know about the home team, worked out once per chart
+# and passed to each of the functions below, so that every line is laid out the same way.
+TextChart = namedtuple("TextChart", ["home_team_abbrev","home_team_abbrev_len","prefix_width"])
+
+def get_text_chart(home_team_abbrev):
+    home_team_abbrev_len = len(home_team_abbrev)
+    return(TextChart(home_team_abbrev, home_team_abbrev_len, DC_PREFIX_WIDTH + home_team_abbrev_len - 1))
+
+# The header strings only depend on the team abbreviations, so remember them rather than building them again.
+@lru_cache(maxsize=None)
+def get_header_field_string(text_chart,r_abbrev):
+    field="%s%s%s%s" % (DC_PREFIX,text_chart.home_team_abbrev,FIELD_HEADER,r_abbrev)
     return (field)    
 
-def get_yard_marker_field_string(h_abbrev):
-    field="%s%s" % (" " * (DC_PREFIX_WIDTH + len(h_abbrev)),YDMRK_HEADER)
+@lru_cache(maxsize=None)
+def get_yard_marker_field_string(text_chart):
+    field="%s%s" % (" " * (DC_PREFIX_WIDTH + text_chart.home_team_abbrev_len),YDMRK_HEADER)
     return (field) 
     
+RESULT_ABBREV = { "Field Goal" : "G", # F would conflict with Fumble
+                  "End of Half" : "H", # E would conflict with End of Game (in OT games, the end of the 4th Quarter is also listed as "End of Half")
+                }
+
 def get_result_abbrev(result):
-    if result == "Field Goal": # F would conflict with Fumble
-        return "G"
-    elif result == "End of Half": # E would conflict with End of Game (in OT games, the end of the 4th Quarter is also listed as "End of Half")
-        return "H"
-    return(result[:1]) # by default, return first letter of the result string
+    return(RESULT_ABBREV.get(result, result[:1])) # by default, return first letter of the result string
     
 def get_net_yards_as_string(net_yards_as_int):
     if net_yards_as_int >= 0:
@@ -68,8 +85,10 @@ def min_sec_from_seconds(seconds):
     
 def get_end_of_drive_info(quarter_start_of_drive,drive_length_in_time,start_time_of_drive):
     if drive_length_in_time.count(":") > 0 and start_time_of_drive.count(":") > 0:
-        drive_length_in_seconds = (int(drive_length_in_time.split(":")[0]) * 60) + int(drive_length_in_time.split(":")[1])
-        start_time_of_drive_in_seconds = (int(start_time_of_drive.split(":")[0]) * 60) + int(start_time_of_drive.split(":")[1])
+        (drive_length_minutes,drive_length_seconds) = drive_length_in_time.split(":")[:2]
+        (start_time_minutes,start_time_seconds) = start_time_of_drive.split(":")[:2]
+        drive_length_in_seconds = (int(drive_length_minutes) * 60) + int(drive_length_seconds)
+        start_time_of_drive_in_seconds = (int(start_time_minutes) * 60) + int(start_time_seconds)
         
         if drive_length_in_seconds <= start_time_of_drive_in_seconds:
             return(quarter_start_of_drive, min_sec_from_seconds(start_time_of_drive_in_seconds - drive_length_in_seconds))
@@ -82,11 +101,21 @@ def get_end_of_drive_info(quarter_start_of_drive,drive_length_in_time,start_time
     # Best we can do is to return the quarter where the drive started, and a blank string for the ending time
     return(str(quarter_start_of_drive),"")
     
+# Text drive formats, looked up by (home team drive, drive went backwards)
+DC_DRIVE_FORMATS = { (True, False) : ">%(dashes)s%(result)1s", # left to right, normal case
+                     (True, True) : "%(result)1s%(dashes)s>",  # left to right, went backwards...
+                     (False, False) : "%(result)1s%(dashes)s<", # right to left, normal case
+                     (False, True) : "<%(dashes)s%(result)1s",  # right to left, went backwards...
+                   }
+
+# All of the strings of dashes we could need, from zero up to the length of the field including the end zones
+DC_DASHES = tuple("-" * n for n in range(121))
+
 # note that quarter represents the quarter where the drive started    
-def get_dc_string(offensive_team_abbrev,home_team_abbrev,plays,net_yards_as_int,quarter,drive_length_in_time,start_time_of_drive,starting_yard_line,ending_yard_line,result):
+def get_dc_string(text_chart,offensive_team_abbrev,plays,net_yards_as_int,quarter,drive_length_in_time,start_time_of_drive,starting_yard_line,ending_yard_line,result):
 
+    #print(text_chart)
     #print(offensive_team_abbrev)
-    #print(home_team_abbrev)
     #print(plays)
     #print(net_yards_as_int)
     #print(quarter)
@@ -99,37 +128,34 @@ def get_dc_string(offensive_team_abbrev,home_team_abbrev,plays,net_yards_as_int,
     net_yards_as_string = get_net_yards_as_string(net_yards_as_int)
         
     # PP: ##-#### ##:## [##:## - ##:##] 
-    summary = plays + "-" + net_yards_as_string
+    summary = "%d-%s" % (plays,net_yards_as_string)
 
-    prefix_width = DC_PREFIX_WIDTH + len(home_team_abbrev) - 1 # assume this abbrev was also passed to get_header_field_string()
     (quarter_end_of_drive,end_time_of_drive) = get_end_of_drive_info(quarter,drive_length_in_time,start_time_of_drive)
-    raw_field = "%2s %2s: %7s %4s [%5s] [%5s %2s]" % (quarter,offensive_team_abbrev,summary,drive_length_in_time,start_time_of_drive,end_time_of_drive,quarter_end_of_drive)
-    raw_field = raw_field + " " * (len(home_team_abbrev) + FIELD_HEADER_WIDTH + len(home_team_abbrev))
+    drive_info = "%2s %2s: %7s %4s [%5s] [%5s %2s]" % (quarter,offensive_team_abbrev,summary,drive_length_in_time,start_time_of_drive,end_time_of_drive,quarter_end_of_drive)
+
+    dc_line_width = len(drive_info) + text_chart.home_team_abbrev_len + FIELD_HEADER_WIDTH + text_chart.home_team_abbrev_len
 
-    if int(plays) > 0:
+    if plays > 0:
 
-        number_of_dashes = abs(int(ending_yard_line) - int(starting_yard_line)) - 1
+        # A drive that gains or loses zero yards has no dashes at all
+        number_of_dashes = max(abs(ending_yard_line - starting_yard_line) - 1, 0)
         
-        if (offensive_team_abbrev == home_team_abbrev): # Drives move left to right
-            left_pos_loc = int(starting_yard_line) + prefix_width
-            right_pos_loc = int(ending_yard_line) + prefix_width
-            if (int(ending_yard_line) >= int(starting_yard_line)): # normal case
-                d_field = ">" + ("-" * number_of_dashes) + "%1s" % (get_result_abbrev(result))
-            else: # went backwards...
-                d_field = "%1s" % (get_result_abbrev(result)) + ("-" * number_of_dashes) + ">"
-        else: # right to left
-            right_pos_loc = int(starting_yard_line) + prefix_width
-            left_pos_loc = int(ending_yard_line) + prefix_width
-            if (int(starting_yard_line) >= int(ending_yard_line)): # normal case
-                d_field = "%1s" % (get_result_abbrev(result)) + ("-" * number_of_dashes) + "<"
-            else: # went backwards...
-                d_field =  "<" + ("-" * number_of_dashes) + "%1s" % (get_result_abbrev(result))
+        # Home team drives move left to right, road team drives move right to left
+        home_team_drive = (offensive_team_abbrev == text_chart.home_team_abbrev)
+        if home_team_drive:
+            left_pos_loc = starting_yard_line + text_chart.prefix_width
+        else:
+            left_pos_loc = ending_yard_line + text_chart.prefix_width
+
+        # A drive that loses yards went backwards...
+        d_field = DC_DRIVE_FORMATS[(home_team_drive, net_yards_as_int < 0)] % { 'dashes' : DC_DASHES[number_of_dashes], 'result' : get_result_abbrev(result) }
         
-        dc_string=raw_field[:left_pos_loc] + d_field + raw_field[(right_pos_loc+1):]
+        # Join the pieces of the line together, padding with spaces on either side of the drive,
+        # so that the whole line is built with a single copy.
+        dc_string = "".join([drive_info, " " * (left_pos_loc - len(drive_info)), d_field, " " * (dc_line_width - left_pos_loc - len(d_field))])
         
     else: # empty drive, likely a kickoff at end of game or half
-        d_field = ""
-        dc_string=raw_field
+        dc_string = drive_info + " " * (dc_line_width - len(drive_info))
         
     return(dc_string)  
     
@@ -137,7 +163,8 @@ def get_dc_string(offensive_team_abbrev,home_team_abbrev,plays,net_yards_as_int,
 # Functions for graphical drive chart output
 #
 
-# To scale the horizontal axis, set a relationship between pixels and yards
+# To scale the horizontal axis, set a relationship between pixels and yards.
+# This also works on NumPy arrays, to convert many yard lines at once.
 pixels_per_yard = 2
 def yds2px(yards):
     return(yards * pixels_per_yard)
@@ -194,92 +221,95 @@ def get_quarter_label_text(quarter):
     # return OT2, OT3, etc. for additional overtime periods
     return("OT" + str(quarter-3))
 
+DC_RESULT_ABBREV = { "Field Goal" : "FG",
+                     "Missed FG" : "MISS FG",
+                     "Touchdown" : "TD",
+                     "Interception" : "INT", # If the interception leads to a Pick 6, this will not show the resulting TD
+                     "Fumble" : "FUM",
+                     "Punt" : "PUNT",
+                     "End of Half" : "HALF",
+                     "End of Game" : "END",
+                     "Downs" : "DOWNS",
+                     "Safety" : "SAF",
+                   }
+
 def get_dc_result_abbrev(result):
-    if result == "Field Goal":
-        return "FG"
-    elif result == "Missed FG":
-        return "MISS FG"
-    elif result == "Touchdown":
-        return "TD"
-    elif result == "Interception": # If the interception leads to a Pick 6, this will not show the resulting TD
-        return "INT"
-    elif result == "Fumble":
-        return "FUM"
-    elif result == "Punt":
-        return "PUNT"
-    elif result == "End of Half":
-        return "HALF"
-    elif result == "End of Game":
-        return "END"
-    elif result == "Downs":
-        return "DOWNS"
-    elif result == "Safety":
-        return "SAF"
-    return(result[:1]) # by default, return first letter of the result string
+    return(DC_RESULT_ABBREV.get(result, result[:1])) # by default, return first letter of the result string
+
+# Returns the "plays-yards time" details that are shown in each drive box, such as "8-75 4:14" or "3-(2) 1:20"
+def get_dc_drive_details(drive):
+    return("%d-%s %s" % (drive.plays,get_net_yards_as_string(drive.net_yards),drive.length))
     
-# TBD: Only need some of these parameters but will include all for now to match get_dc_string()
-# Returns lefthand yardage line - not including borders and end zone - plus the width of the box we need.
+# Returns an array with one row per drive: the lefthand yardage line - not including borders and end zone - plus the width of the box we need.
+# The coordinates for all of the drives are calculated at once, so the caller can draw all of the boxes together.
 # This function does NOT adjust the width based on the pixels_per_yard. The caller must do that adjustment. 
-def get_dc_coords(offensive_team_abbrev,home_team_abbrev,plays,net_yards_as_int,quarter,drive_length_in_time,start_time_of_drive,starting_yard_line,ending_yard_line,result):
-
-    #print(offensive_team_abbrev)
-    #print(home_team_abbrev)
-    #print(plays)
-    #print(net_yards_as_int)
-    #print(quarter)
-    #print(drive_length_in_time)
-    #print(start_time_of_drive)
-    #print(starting_yard_line)
-    #print(ending_yard_line)
-    #print(result)
-
-    if int(plays) > 0:
-
-        # unlike text version, we do not need space for a result and a ">" or "<" at start of drive
-        width = abs(int(ending_yard_line) - int(starting_yard_line)) + 1 
-        
-        if (offensive_team_abbrev == home_team_abbrev): # Drives move left to right
-            if net_yards_as_int >= 0:
-                left = int(starting_yard_line)
-            else:
-                left = int(starting_yard_line) + net_yards_as_int
-        else: # right to left
-            if net_yards_as_int >= 0:
-                left = int(ending_yard_line)
-            else:
-                left = int(ending_yard_line) + net_yards_as_int
-        
-    else: # empty drive, likely a kickoff at end of game or half, so will draw nothing for this
-        left = 0
-        width = 0
-        
-    return(left, width)
+def get_all_dc_coords(drive_array,home_team_abbrev):
+    plays = np.array([d.plays for d in drive_array], dtype=int)
+    net_yards = np.array([d.net_yards for d in drive_array], dtype=int)
+    starting_yard_lines = np.array([d.starting_yard_line for d in drive_array], dtype=int)
+    ending_yard_lines = np.array([d.ending_yard_line for d in drive_array], dtype=int)
+    home_team_drives = np.array([d.offensive_team == home_team_abbrev for d in drive_array], dtype=bool)
+
+    # unlike text version, we do not need space for a result and a ">" or "<" at start of drive
+    width = np.abs(ending_yard_lines - starting_yard_lines) + 1
+
+    # Home team drives move left to right, road team drives move right to left
+    left = np.where(home_team_drives, starting_yard_lines, ending_yard_lines)
+    left = np.where(net_yards >= 0, left, left + net_yards)
+
+    # empty drive, likely a kickoff at end of game or half, so will draw nothing for this
+    empty_drives = (plays <= 0)
+    left[empty_drives] = 0
+    width[empty_drives] = 0
+
+    return(np.column_stack((left, width)))
     
 
-# Arrow will point in the "direction" passed in (left or right)
-# The box_y_coord is the bottom of the drive box
-# The box_x_coord is either the left-hand x coordinate or the right-hand x coordinate of the drive box
-def get_triangle_coords(direction,box_x_coord,box_y_coord,box_height,width):
+# Arrows will point in the "direction" passed in (left or right) for each drive.
+# The box_y_coords are the bottom of each drive box.
+# The box_x_coords are either the left-hand x coordinate or the right-hand x coordinate of each drive box.
+# The triangles for all of the drives are calculated at once, and returned in an array of shape (drives, 3 points, x/y).
+def get_triangle_coords(directions,box_x_coords,box_y_coords,box_height,width):
+    point_right = (np.asarray(directions) == "right")
+    box_x_coords = np.asarray(box_x_coords)
+
     # Create a horizontal spacer between the box and the arrow
-    if direction == "left":
-        x = box_x_coord - 1
-    else: # right
-        x = box_x_coord + 1
+    x = np.where(point_right, box_x_coords + 1, box_x_coords - 1)
 
     # The arrows look better if we shrink the height by 2 pixels and add 1 to the y coordinate,
     # in order to center the arrow. This assumes that the box height is an EVEN number.
-    y = box_y_coord + 1
+    y = np.asarray(box_y_coords) + 1
     height = box_height - 2
     
-    t_left = (x, y)
-    if direction == "left":
-        t_right = (x - (width/2), y + (height/2))
-    else:
-        t_right = (x + (width/2), y + (height/2))
-    t_top = (x, y + height)    
-    t_points = np.array([t_left,t_right,t_top])
+    # Fill in the points directly, rather than building up separate arrays for each point and stacking them.
+    t_points = np.empty((len(x), 3, 2), dtype=np.float64)
+    t_points[:, 0, 0] = x # left
+    t_points[:, 0, 1] = y
+    t_points[:, 1, 0] = np.where(point_right, x + (width/2), x - (width/2)) # right
+    t_points[:, 1, 1] = y + (height/2)
+    t_points[:, 2, 0] = x # top
+    t_points[:, 2, 1] = y + height
     return(t_points)
 
+# The box_x_coords and box_y_coords are the bottom left-hand corner of each drive box.
+# The boxes for all of the drives are calculated at once, and returned in an array of shape (drives, 4 points, x/y).
+def get_box_coords(box_x_coords,box_y_coords,box_widths,box_height):
+    x = np.asarray(box_x_coords, dtype=np.float64)
+    y = np.asarray(box_y_coords, dtype=np.float64)
+    right = x + np.asarray(box_widths, dtype=np.float64)
+    
+    # Same point order as a Rectangle: bottom left, bottom right, top right, top left
+    b_points = np.empty((len(x), 4, 2), dtype=np.float64)
+    b_points[:, 0, 0] = x
+    b_points[:, 0, 1] = y
+    b_points[:, 1, 0] = right
+    b_points[:, 1, 1] = y
+    b_points[:, 2, 0] = right
+    b_points[:, 2, 1] = y + box_height
+    b_points[:, 3, 0] = x
+    b_points[:, 3, 1] = y + box_height
+    return(b_points)
+
     
 # ========================================================================
 # Functions for loading and manipulating simple drive data.
@@ -287,105 +317,107 @@ def get_triangle_coords(direction,box_x_coord,box_y_coord,box_height,width):
 # box score pages.
 #
 
+# Each drive is stored as a named tuple, holding the fields of the .csv line from the file
+# (#,Quarter,Time,LOS,Plays,Length,Net Yds,Result,OptionalComment) plus some additional data.
+# The numbers are already converted to ints so that they never have to be parsed again,
+# and the fields are always accessed by name.
+# Note that the "#" column (number) reflects the number of drives by the offensive_team
+Drive = namedtuple("Drive", ["number","quarter","start_time","los","plays","length","net_yards","result","comment",
+                             "offensive_team","elapsed_time","starting_yard_line","ending_yard_line"])
+
 def read_drive_datafile(the_file,r,h,team_home_or_road,offensive_team):
     drive_array = []
-    with open(the_file,'r') as ifile:
-        for line in ifile:
-            # .csv format assumed to be: Drive#,Quarter,Time,LOS,Plays,Length,Net Yds,Result
-            # User can also append an extra column of optional commentary
-            if len(line) > 0 and ("Quarter" not in line) and line.count(",") >= 7:
-                # Calculate elapsed time at start of drive                
-                quarter = int(line.split(",")[1])
-                clock_time = line.split(",")[2]
-                # assume 15 minute quarters, but this also works for 10 minute overtime periods if we use it only for sorting purposes
-                elapsed_time_from_start_of_game_in_seconds = (15*60*quarter) - ((int(clock_time.split(":")[0]) * 60) + int(clock_time.split(":")[1]))
-                
-                # Calculate field position at start and end of drive based on a 0 to 100 scale (left-to-right)
-                plays = line.split(",")[4]
-                starting_field_position = line.split(",")[3]
-                
-                # In SB51 there was just a kickoff before halftime which resulted in a zero-play drive with no line of scrimmage info
-                # In SB49 there was a drive that started at midfield, and PFR listed the LOS as blank.
-                if int(plays) > 0:
-
-                    if len(starting_field_position) > 0:
-                        starting_field_team = starting_field_position.split(" ")[0]
-                        starting_field_yard_line = starting_field_position.split(" ")[1]
-                        if starting_field_team == h:
-                            adjusted_starting_yard_line = int(starting_field_yard_line)
-                        else:
-                            adjusted_starting_yard_line = 100 - int(starting_field_yard_line)
-                    else: # assume midfield for now
-                        adjusted_starting_yard_line = 50
-                        
-                    net_yards = line.split(",")[6]
 
-                    if team_home_or_road == "HOME": # draw drives left-to-right
-                        adjusted_ending_yard_line = adjusted_starting_yard_line + int(net_yards)
-                    else: # draw drives right-to-left
-                        adjusted_ending_yard_line = adjusted_starting_yard_line - int(net_yards)
-                        
-                else: # Zero-play drive
-                    adjusted_starting_yard_line = -1
-                    adjusted_ending_yard_line = -1
-
-                line = line.strip()
-                if line.count(",") == 7:
-                    # There is no optional comment on this .csv line, so append a comma at the end to 
-                    # create an empty column. But need to strip off the line ending (Newline, CR, LF, etc.) first.
-                    line = line + ","
-
-                # In the drive array, store the entire .csv line from the file, plus some additional data.                    
-                # Note that the "#" column reflects the number of drives by the offensive_team
-                #        0 1       2    3   4     5      6       7      8
-                # line = #,Quarter,Time,LOS,Plays,Length,Net Yds,Result,OptionalComment
-                #                                           9              10                                          11                          12                       
-                new_line = "%s,%s,%s,%s,%s" % (line,offensive_team,elapsed_time_from_start_of_game_in_seconds,adjusted_starting_yard_line,adjusted_ending_yard_line)
-                drive_array.append(new_line)
+    # The direction of the drives only depends on the team, so work it out once instead of once per drive.
+    if team_home_or_road == "HOME": # draw drives left-to-right
+        drive_direction = 1
+    else: # draw drives right-to-left
+        drive_direction = -1
+
+    # The files are small, so read the whole file at once and split it into lines,
+    # which also takes care of the line endings (Newline, CR, LF, etc.)
+    with open(the_file,'r',newline='') as ifile:
+        lines = ifile.read().splitlines()
+
+    # Some Windows editors (and Excel's "CSV UTF-8") put a UTF-8 byte order mark at the start of the file.
+    # Depending on the default encoding, it is read as either "\ufeff" or "\u00ef\u00bb\u00bf", so drop either one.
+    if len(lines) > 0:
+        for byte_order_mark in ("\ufeff","\u00ef\u00bb\u00bf"):
+            if lines[0].startswith(byte_order_mark):
+                lines[0] = lines[0][len(byte_order_mark):]
+
+    # The header line is always the first non-blank line in the file, so drop it here rather than checking every line for it.
+    # Blank lines are skipped by the len(fields) check below.
+    first_line = 0
+    while first_line < len(lines) and len(lines[first_line].strip()) == 0:
+        first_line += 1
+    if first_line < len(lines) and lines[first_line].startswith("#,Quarter"):
+        del lines[first_line]
+
+    # Let the csv module (which is implemented in C) split each line into fields
+    for fields in csv.reader(lines):
+        # .csv format assumed to be: Drive#,Quarter,Time,LOS,Plays,Length,Net Yds,Result
+        # User can also append an extra column of optional commentary
+        if len(fields) >= 8:
+            # Calculate elapsed time at start of drive                
+            quarter = int(fields[1])
+            clock_time = fields[2]
+            (clock_minutes,clock_seconds) = clock_time.split(":")
+            # assume 15 minute quarters, but this also works for 10 minute overtime periods if we use it only for sorting purposes
+            elapsed_time_from_start_of_game_in_seconds = (15*60*quarter) - ((int(clock_minutes) * 60) + int(clock_seconds))
+            
+            # Calculate field position at start and end of drive based on a 0 to 100 scale (left-to-right)
+            plays = int(fields[4])
+            net_yards = int(fields[6])
+            starting_field_position = fields[3]
+            
+            # In SB51 there was just a kickoff before halftime which resulted in a zero-play drive with no line of scrimmage info
+            # In SB49 there was a drive that started at midfield, and PFR listed the LOS as blank.
+            if plays > 0:
+
+                if len(starting_field_position) > 0:
+                    (starting_field_team,starting_field_yard_line) = starting_field_position.split(" ",2)[:2]
+                    if starting_field_team == h:
+                        adjusted_starting_yard_line = int(starting_field_yard_line)
+                    else:
+                        adjusted_starting_yard_line = 100 - int(starting_field_yard_line)
+                else: # assume midfield for now
+                    adjusted_starting_yard_line = 50
+                    
+                adjusted_ending_yard_line = adjusted_starting_yard_line + (drive_direction * net_yards)
+                    
+            else: # Zero-play drive
+                adjusted_starting_yard_line = -1
+                adjusted_ending_yard_line = -1
+
+            if len(fields) > 8:
+                optional_comment = fields[8]
+            else: # There is no optional comment on this .csv line
+                optional_comment = ""
+
+            # Append a Drive with the parsed fields from this line, plus some additional data.
+            drive_array.append(Drive(fields[0],quarter,clock_time,starting_field_position,plays,fields[5],net_yards,fields[7],optional_comment,
+                                     offensive_team,elapsed_time_from_start_of_game_in_seconds,adjusted_starting_yard_line,adjusted_ending_yard_line))
     
-    ifile.close()
     return drive_array
     
-# Brute-force merging of two drive arrays into a single array, sorted by the
-# starting time of the drive.
-COL_FOR_LENGTH_OF_DRIVE_IN_TIME = 5
-COL_FOR_ELAPSED_TIME_SINCE_START_OF_GAME = 10
+# Merge two drive arrays into a single array, sorted by the starting time of
+# the drive. Each array is already in order, so heapq.merge() can do this for us.
+def get_drive_sort_key(drive):
+    # If the times are an exact match, assume that one team had a drive that lasted 
+    # zero seconds, and sort that drive first.
+    if drive.length == "0:00":
+        return (drive.elapsed_time, 0)
+    return (drive.elapsed_time, 1)
+
 def merge_drive_arrays(d1,d2):
-    d_merged = []
-    d1_index = d2_index = 0
-    d1_len = len(d1)
-    d2_len = len(d2)
-    
-    while d1_index < d1_len or d2_index < d2_len:
-        if d1_index < d1_len and d2_index < d2_len:
-            d1_elapsed_time = int(d1[d1_index].split(",")[COL_FOR_ELAPSED_TIME_SINCE_START_OF_GAME])
-            d2_elapsed_time = int(d2[d2_index].split(",")[COL_FOR_ELAPSED_TIME_SINCE_START_OF_GAME])
-#            print("Time %s vs. %s" % (d1_elapsed_time,d2_elapsed_time))
-            if d1_elapsed_time < d2_elapsed_time:
-                d_merged.append(d1[d1_index])
-                d1_index += 1
-            elif d1_elapsed_time > d2_elapsed_time:
-                d_merged.append(d2[d2_index])
-                d2_index += 1
-            else: # times are an exact match, assume that one team had a drive that lasted zero seconds
-                d1_drive_time = d1[d1_index].split(",")[COL_FOR_LENGTH_OF_DRIVE_IN_TIME]
-                d2_drive_time = d2[d2_index].split(",")[COL_FOR_LENGTH_OF_DRIVE_IN_TIME]
-                if d1_drive_time == "0:00":
-                    d_merged.append(d1[d1_index])
-                    d1_index += 1                    
-                elif d2_drive_time == "0:00":
-                    d_merged.append(d2[d2_index])
-                    d2_index += 1
-                else:
-                    print("Two drives found lasting two seconds - exiting")
-                    quit()
-        else: # drain whichever array still contains drive info
-            while d1_index < d1_len:
-                d_merged.append(d1[d1_index])
-                d1_index += 1
-            while d2_index < d2_len:
-                d_merged.append(d2[d2_index])
-                d2_index += 1
+    d_merged = list(heapq.merge(d1,d2,key=get_drive_sort_key))
+
+    # Two drives that start at the same time should never both last longer than zero seconds
+    for (previous_drive,drive) in zip(d_merged,d_merged[1:]):
+        previous_key = get_drive_sort_key(previous_drive)
+        if previous_key[1] == 1 and previous_key == get_drive_sort_key(drive):
+            raise RuntimeError("Two drives start %d seconds into the game and neither lasted zero seconds (%s and %s)" % (drive.elapsed_time,previous_drive.length,drive.length))
                 
     return d_merged
 
@@ -401,13 +433,11 @@ parser.add_argument('-exchangecolor', '-e', help="Exchange primary and secondary
 args = parser.parse_args()
 
 if args.drivedata:
-    road_drive_datafile = args.drivedata.split(",")[0]
-    home_drive_datafile = args.drivedata.split(",")[1]
+    (road_drive_datafile,home_drive_datafile) = args.drivedata.split(",",2)[:2]
 else:
     print("Must specify drive data files")
     
-road_abbrev = args.teams.split(",")[0]
-home_abbrev = args.teams.split(",")[1]
+(road_abbrev,home_abbrev) = args.teams.split(",",2)[:2]
 
 print("%s,%s,%s,%s" % (road_drive_datafile,home_drive_datafile,road_abbrev,home_abbrev))
 
@@ -424,17 +454,22 @@ merged_drive_data = merge_drive_arrays(road_drive_data,home_drive_data)
 #print("\n")
 
 # Print a cleaner table for use alongside the graphical file.
-print("Team,Q,StartTime,StartYardline,Plays,Time,Yards,Result")
-for d in merged_drive_data:
-    print("%s,%s" % (d.split(",")[9],','.join(d.split(",")[1:8])))
-print("\n")
+# The csv module takes care of quoting any field that happens to contain a comma.
+summary_writer = csv.writer(sys.stdout, lineterminator="\n")
+summary_writer.writerow(["Team","Q","StartTime","StartYardline","Plays","Time","Yards","Result"])
+summary_writer.writerows((d.offensive_team,d.quarter,d.start_time,d.los,d.plays,d.length,d.net_yards,d.result) for d in merged_drive_data)
+sys.stdout.write("\n\n")
     
-print("%s" % ( get_yard_marker_field_string(home_abbrev)))
-print("%s" % (get_header_field_string(road_abbrev,home_abbrev)))
-for d in merged_drive_data:  
-    # args = offensive_team_abbrev,home_team_abbrev,plays,net_yards_as_int,quarter,drive_length_in_time,start_time_of_drive,starting_yard_line,ending_yard_line,result
-    dc_line = get_dc_string(d.split(",")[9],home_abbrev,d.split(",")[4],int(d.split(",")[6]),d.split(",")[1],d.split(",")[5],d.split(",")[2],d.split(",")[11],d.split(",")[12],d.split(",")[7])
-    print("%s" % (dc_line))
+# The text chart is built up as a list of lines and written out all at once.
+text_chart = get_text_chart(home_abbrev)
+dc_lines = [get_yard_marker_field_string(text_chart),get_header_field_string(text_chart,road_abbrev)]
+# args = text_chart,offensive_team_abbrev,plays,net_yards_as_int,quarter,drive_length_in_time,start_time_of_drive,starting_yard_line,ending_yard_line,result
+dc_lines.extend(get_dc_string(text_chart,d.offensive_team,d.plays,d.net_yards,d.quarter,d.length,d.start_time,d.starting_yard_line,d.ending_yard_line,d.result) for d in merged_drive_data)
+sys.stdout.write("\n".join(dc_lines) + "\n")
+
+# Drives with no plays are listed in the tables above, but nothing is drawn for them, so drop them
+# before building the graphical chart.
+drawn_drive_data = [d for d in merged_drive_data if d.plays > 0]
     
 # Set this based on the number of drives, with a minimum height of 58 yards = 54 + 2 + 2
 # Need enough room to fit all of the drives in between the yardage markers.
@@ -464,6 +499,11 @@ width_of_drive_arrows = height_of_drive_box * (field_width_with_borders / field_
 fig, ax = plt.subplots(figsize=(figure_size_width, figure_size_height)) # default is 6.8 inches by 4.6 inches? with dpi=100
 ax.set_xlim([0,field_width_with_borders+1]) # I had trouble with the outer black border looking "solid" unless I added 1 to both of these limits.
 ax.set_ylim([0,field_height_with_borders+1]) 
+# The limits are fixed, so there is no need for matplotlib to rescale the axes as each artist is added.
+ax.set_autoscale_on(False)
+ax.use_sticky_edges = False
+# Anything below zorder 1 (the field stripes) is rasterized when saving to a vector format.
+ax.set_rasterization_zorder(1)
 
 # The first quarter label will be located between the top of the field and the 
 # (end of) first quarter dashed line.
@@ -507,11 +547,9 @@ team_nicknames = { 'NWE' : "Patriots",
 
 # Mapping of team abbrevations used by Pro Football Reference to team colors.
 #
-# The first dictionary are the primary colors, which are the defaults for the
-# end zones and the drive boxes.
-#
-# The second dictionary are the secondary colors, which are the defaults for
-# the team names in the end zones and the outline of the drive boxes.
+# Each team has a TeamStyle of (primary, secondary). The primary colors are the
+# defaults for the end zones and the drive boxes. The secondary colors are the
+# defaults for the team names in the end zones and the outline of the drive boxes.
 #
 # If the primary colors for the two teams are similar, the "exchangecolor" argument
 # gives us a work-around where the secondary color will be used in place of the
@@ -523,310 +561,240 @@ team_nicknames = { 'NWE' : "Patriots",
 
 # https://matplotlib.org/stable/tutorials/colors/colors.html
 # https://teamcolorcodes.com/nfl-team-color-codes/
-primary_team_colors = { 'NWE' : '#002244',
-                        'BAL' : '#241773',
-                        'BUF' : '#00338D',
-                        'DEN' : '#FB4F14',
-                        'MIA' : '#008E97',
-                        'NYJ' : '#125740',
-                        'CIN' : '#FB4F14',
-                        'CLE' : '#311D00',
-                        'HOU' : '#03202F',
-                        'IND' : '#002C5F',
-                        'JAX' : '#D7A22A', # could also be black (101820)
-                        'KAN' : '#E31837',
-                        'LAC' : '#0080C6', 'SDG' : '#0080C6',
-                        'LVR' : '#000000', 'OAK' : '#000000',
-                        'PIT' : '#101820',
-                        'TEN' : '#0C2340',
-                        'ARI' : '#97233F',
-                        'ATL' : '#A71930',
-                        'CAR' : '#0085CA',
-                        'CHI' : '#0B162A',
-                        'DAL' : '#041E42',
-                        'DET' : '#0076B6',
-                        'GNB' : '#203731',
-                        'LAR' : '#003594', 'STL' : '#002244',
-                        'MIN' : '#4F2683',
-                        'NYG' : '#0B2265',
-                        'NOR' : '#101820',
-                        'PHI' : '#004C54',
-                        'SEA' : '#002244', # same as NWE
-                        'SFO' : '#AA0000',
-                        'TAM' : '#FF7900', # Or Red: '#D50A0A',
-                        'WAS' : '#5A1414',
-                      }
-secondary_team_colors = { 'NWE' : '#B0B7BC',
-                          'BAL' : '#9E7C0C',
-                          'BUF' : '#C60C30',
-                          'CIN' : '#000000',
-                          'CLE' : '#FF3C00',
-                          'DEN' : '#002244',
-                          'HOU' : '#A71930',
-                          'IND' : '#A2AAAD',
-                          'JAX' : '#006778',
-                          'KAN' : '#FFB81C',
-                          'LAC' : '#FFC20E', 'SDG' : '#FFC20E',
-                          'LVR' : '#A5ACAF', 'OAK' : '#A5ACAF',
-                          'MIA' : '#FC4C02',
-                          'NYJ' : '#000000', # Should be white so could make this gray
-                          'PIT' : '#FFB612',
-                          'TEN' : '#4B92DB',
-                          'ARI' : '#000000',
-                          'ATL' : '#000000',
-                          'CAR' : '#101820',
-                          'CHI' : '#C83803',
-                          'DAL' : '#869397',
-                          'DET' : '#B0B7BC',
-                          'GNB' : '#FFB612',
-                          'LAR' : '#FFA300', 'STL' : '#866D4B',
-                          'MIN' : '#FFC62F',
-                          'NOR' : '#D3BC8D',
-                          'NYG' : '#A71930',
-                          'PHI' : '#ACC0C6',
-                          'SEA' : '#69BE28',
-                          'SFO' : '#B3995D',
-                          'TAM' : '#34302B',
-                          'WAS' : '#FFB612',
-                        }
-
-home_team_primary_color = primary_team_colors[home_abbrev]
-home_team_secondary_color = secondary_team_colors[home_abbrev]
-road_team_primary_color = primary_team_colors[road_abbrev]
-road_team_secondary_color = secondary_team_colors[road_abbrev]
-
-# This argument provides flexibility for cases where the primary colors for
+TeamStyle = namedtuple("TeamStyle", ["primary","secondary"])
+
+TEAM_COLORS = { 'NWE' : TeamStyle('#002244','#B0B7BC'),
+                'BAL' : TeamStyle('#241773','#9E7C0C'),
+                'BUF' : TeamStyle('#00338D','#C60C30'),
+                'DEN' : TeamStyle('#FB4F14','#002244'),
+                'MIA' : TeamStyle('#008E97','#FC4C02'),
+                'NYJ' : TeamStyle('#125740','#000000'), # secondary should be white so could make this gray
+                'CIN' : TeamStyle('#FB4F14','#000000'),
+                'CLE' : TeamStyle('#311D00','#FF3C00'),
+                'HOU' : TeamStyle('#03202F','#A71930'),
+                'IND' : TeamStyle('#002C5F','#A2AAAD'),
+                'JAX' : TeamStyle('#D7A22A','#006778'), # primary could also be black (101820)
+                'KAN' : TeamStyle('#E31837','#FFB81C'),
+                'LAC' : TeamStyle('#0080C6','#FFC20E'), 'SDG' : TeamStyle('#0080C6','#FFC20E'),
+                'LVR' : TeamStyle('#000000','#A5ACAF'), 'OAK' : TeamStyle('#000000','#A5ACAF'),
+                'PIT' : TeamStyle('#101820','#FFB612'),
+                'TEN' : TeamStyle('#0C2340','#4B92DB'),
+                'ARI' : TeamStyle('#97233F','#000000'),
+                'ATL' : TeamStyle('#A71930','#000000'),
+                'CAR' : TeamStyle('#0085CA','#101820'),
+                'CHI' : TeamStyle('#0B162A','#C83803'),
+                'DAL' : TeamStyle('#041E42','#869397'),
+                'DET' : TeamStyle('#0076B6','#B0B7BC'),
+                'GNB' : TeamStyle('#203731','#FFB612'),
+                'LAR' : TeamStyle('#003594','#FFA300'), 'STL' : TeamStyle('#002244','#866D4B'),
+                'MIN' : TeamStyle('#4F2683','#FFC62F'),
+                'NYG' : TeamStyle('#0B2265','#A71930'),
+                'NOR' : TeamStyle('#101820','#D3BC8D'),
+                'PHI' : TeamStyle('#004C54','#ACC0C6'),
+                'SEA' : TeamStyle('#002244','#69BE28'), # primary is the same as NWE
+                'SFO' : TeamStyle('#AA0000','#B3995D'),
+                'TAM' : TeamStyle('#FF7900','#34302B'), # primary could also be red: '#D50A0A'
+                'WAS' : TeamStyle('#5A1414','#FFB612'),
+              }
+
+# Returns the TeamStyle for a team, with the primary and secondary colors exchanged if requested.
+def team_colors(team_abbrev,exchange):
+    style = TEAM_COLORS[team_abbrev]
+    return(TeamStyle(style.secondary,style.primary) if exchange else style)
+
+# The -exchangecolor argument provides flexibility for cases where the primary colors for
 # the two teams are either the same or very similar, so the secondary color
 # provides better contrast and creates an easier-to-follow drive chart.
-if args.exchangecolor:
-    if args.exchangecolor == home_abbrev:
-        temp_color = home_team_primary_color
-        home_team_primary_color = home_team_secondary_color
-        home_team_secondary_color = temp_color
-    elif args.exchangecolor == road_abbrev:
-        temp_color = road_team_primary_color
-        road_team_primary_color = road_team_secondary_color
-        road_team_secondary_color = temp_color
+home_team_colors = team_colors(home_abbrev,args.exchangecolor == home_abbrev)
+road_team_colors = team_colors(road_abbrev,args.exchangecolor == road_abbrev)
+(home_team_primary_color,home_team_secondary_color) = home_team_colors
+(road_team_primary_color,road_team_secondary_color) = road_team_colors
 
                         
 # ---- Draw the football field
 
+# Both end zones are the full height of the field, so the team nickname is centered vertically on the field.
+endzone_width = yds2px(10)
+endzone_text_y_coord = field_borders + field_height/2.0
+
                                                            # First four args = (left, bottom), width, height
-home_endzone_rectangles = { team_nicknames[home_abbrev].upper() : patches.Rectangle((field_borders,field_borders),yds2px(10),field_height, facecolor=home_team_primary_color) }
-                       
-for r in home_endzone_rectangles:
-    ax.add_artist(home_endzone_rectangles[r])
-    rx, ry = home_endzone_rectangles[r].get_xy()
-    cx = rx + home_endzone_rectangles[r].get_width()/2.0
-    cy = ry + home_endzone_rectangles[r].get_height()/2.0
-    ax.annotate(r, (cx, cy), color=home_team_secondary_color, weight='bold', 
-                fontsize=30, ha='center', va='center', rotation=90) # used 16 with pixels_per_yard = 1
-    # Reference: https://matplotlib.org/stable/tutorials/text/text_props.html                
-                
-road_endzone_rectangles = { team_nicknames[road_abbrev].upper() : patches.Rectangle((yds2px(111)+field_borders,field_borders),yds2px(10),field_height, facecolor=road_team_primary_color) }
-                       
-for r in road_endzone_rectangles:
-    ax.add_artist(road_endzone_rectangles[r])
-    rx, ry = road_endzone_rectangles[r].get_xy()
-    cx = rx + road_endzone_rectangles[r].get_width()/2.5 # This is not a typo. I find that 270-degree rotated text tends to be rendered off-center (too far to the right) so I adjust the cx coord to shift it back to the left.
-    cy = ry + road_endzone_rectangles[r].get_height()/2.0
-    ax.annotate(r, (cx, cy), color=road_team_secondary_color, weight='bold', 
-                fontsize=30, ha='center', va='center', rotation=270) # used 16 with pixels_per_yard = 1
+ax.add_patch(patches.Rectangle((field_borders,field_borders),endzone_width,field_height, facecolor=home_team_primary_color))
+ax.text(field_borders + endzone_width/2.0, endzone_text_y_coord, team_nicknames[home_abbrev].upper(), color=home_team_secondary_color, weight='bold', 
+        fontsize=30, ha='center', va='center', rotation=90) # used 16 with pixels_per_yard = 1
+# Reference: https://matplotlib.org/stable/tutorials/text/text_props.html                
+
+road_endzone_x_coord = yds2px(111)+field_borders
+ax.add_patch(patches.Rectangle((road_endzone_x_coord,field_borders),endzone_width,field_height, facecolor=road_team_primary_color))
+# Dividing by 2.5 is not a typo. I find that 270-degree rotated text tends to be rendered off-center (too far to the right) so I adjust the x coord to shift it back to the left.
+ax.text(road_endzone_x_coord + endzone_width/2.5, endzone_text_y_coord, team_nicknames[road_abbrev].upper(), color=road_team_secondary_color, weight='bold', 
+        fontsize=30, ha='center', va='center', rotation=270) # used 16 with pixels_per_yard = 1
                 
 # Note the tweak to the "bottom" and "height" coordinates. When I tried to place the border at 0,0,... the bottom line looked too thin.                
-field_rectangles = { 'outerborder' : patches.Rectangle((0,1),field_width_with_borders,field_height_with_borders-1, facecolor='none', linewidth=1, edgecolor='black'),
-                     'h0to5' : patches.Rectangle((field_borders+yds2px(11),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'h5to10' : patches.Rectangle((field_borders+yds2px(16),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'h10to15' : patches.Rectangle((field_borders+yds2px(21),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'h15to20' : patches.Rectangle((field_borders+yds2px(26),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'h20to25' : patches.Rectangle((field_borders+yds2px(31),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'h25to30' : patches.Rectangle((field_borders+yds2px(36),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'h30to35' : patches.Rectangle((field_borders+yds2px(41),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'h35to40' : patches.Rectangle((field_borders+yds2px(46),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'h40to45' : patches.Rectangle((field_borders+yds2px(51),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'h45to50' : patches.Rectangle((field_borders+yds2px(56),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'r50to45' : patches.Rectangle((field_borders+yds2px(61),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'r45to40' : patches.Rectangle((field_borders+yds2px(66),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'r40to35' : patches.Rectangle((field_borders+yds2px(71),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'r35to30' : patches.Rectangle((field_borders+yds2px(76),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'r30to25' : patches.Rectangle((field_borders+yds2px(81),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'r25to20' : patches.Rectangle((field_borders+yds2px(86),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'r20to15' : patches.Rectangle((field_borders+yds2px(91),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'r15to10' : patches.Rectangle((field_borders+yds2px(96),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'r10to5' : patches.Rectangle((field_borders+yds2px(101),field_borders),yds2px(4),field_height, facecolor='green'),
-                     'r5to0' : patches.Rectangle((field_borders+yds2px(106),field_borders),yds2px(4),field_height, facecolor='green'),
-                   }                
-
-for r in field_rectangles:
-    ax.add_artist(field_rectangles[r])                   
+field_border = patches.Rectangle((0,1),field_width_with_borders,field_height_with_borders-1, facecolor='none', linewidth=1, edgecolor='black')
+ax.add_artist(field_border)
+
+# The green stripes in between the 5-yd lines, starting with the home team's 0-5 and ending with the road team's 5-0,
+# are all drawn as a single collection rather than one artist at a time.
+# The x coordinates are converted from yards to pixels for all of the stripes at once.
+field_stripe_x_coords = field_borders + yds2px(np.arange(11,107,5))
+field_stripe_width = yds2px(4)
+field_stripes = [ patches.Rectangle((x,field_borders),field_stripe_width,field_height, facecolor='green') for x in field_stripe_x_coords ]
+ax.add_collection(collections.PatchCollection(field_stripes, match_original=True, zorder=0, rasterized=True))
 
 # The 9's here are based on placing a box in between two successive 5-yd lines (4 + 1 + 4) such that the
 # yardage marker is centered in between. On real NFL fields, you can see the yardage line in between the 
 # "X" and the "0" but I think that would be harder to read than the format I have chosen here.
+# The boxes for each row of yardage markers are drawn as a single collection, with the text added on top of them.
+# The text is centered on each box, using the same x coordinates for the top and bottom rows and a single font.
+yardage_marker_x_coords = field_borders + yds2px(np.arange(16,97,10))
+yardage_marker_width = yds2px(9)
+yardage_marker_text_x_coords = yardage_marker_x_coords + yardage_marker_width/2.0
+yardage_marker_font = FontProperties(weight='bold', size=10)
 bottom_coord_for_yardage_markers = field_borders + yd_mrk_distance_from_border
-yardage_markers = { '<10' : patches.Rectangle((field_borders+yds2px(16),bottom_coord_for_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '<20' : patches.Rectangle((field_borders+yds2px(26),bottom_coord_for_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '<30' : patches.Rectangle((field_borders+yds2px(36),bottom_coord_for_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '<40' : patches.Rectangle((field_borders+yds2px(46),bottom_coord_for_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '50' : patches.Rectangle((field_borders+yds2px(56),bottom_coord_for_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '40>' : patches.Rectangle((field_borders+yds2px(66),bottom_coord_for_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '30>' : patches.Rectangle((field_borders+yds2px(76),bottom_coord_for_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '20>' : patches.Rectangle((field_borders+yds2px(86),bottom_coord_for_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '10>' : patches.Rectangle((field_borders+yds2px(96),bottom_coord_for_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                  }
+yardage_marker_labels = [ '<10', '<20', '<30', '<40', '50', '40>', '30>', '20>', '10>' ]
+yardage_markers = [ patches.Rectangle((x,bottom_coord_for_yardage_markers),yardage_marker_width,yardage_marker_height, facecolor='green') for x in yardage_marker_x_coords ]
+ax.add_collection(collections.PatchCollection(yardage_markers, match_original=True))
  
-for r in yardage_markers:
-    ax.add_artist(yardage_markers[r])
-    rx, ry = yardage_markers[r].get_xy()
-    cx = rx + yardage_markers[r].get_width()/2.0
-    cy = ry + yardage_markers[r].get_height()/2.0
-    ax.annotate(r, (cx, cy), color='w', weight='bold', 
-                fontsize=10, ha='center', va='center')
+cy = bottom_coord_for_yardage_markers + yardage_marker_height/2.0
+for (label,cx) in zip(yardage_marker_labels,yardage_marker_text_x_coords):
+    ax.text(cx, cy, label, color='w', fontproperties=yardage_marker_font, ha='center', va='center')
 
 bottom_coord_for_top_yardage_markers = field_height_with_borders-field_borders - yd_mrk_distance_from_border - yardage_marker_height
-top_yardage_markers = { '10>' : patches.Rectangle((field_borders+yds2px(16),bottom_coord_for_top_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '20>' : patches.Rectangle((field_borders+yds2px(26),bottom_coord_for_top_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '30>' : patches.Rectangle((field_borders+yds2px(36),bottom_coord_for_top_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '40>' : patches.Rectangle((field_borders+yds2px(46),bottom_coord_for_top_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '50' : patches.Rectangle((field_borders+yds2px(56),bottom_coord_for_top_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '<40' : patches.Rectangle((field_borders+yds2px(66),bottom_coord_for_top_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '<30' : patches.Rectangle((field_borders+yds2px(76),bottom_coord_for_top_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '<20' : patches.Rectangle((field_borders+yds2px(86),bottom_coord_for_top_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                    '<10' : patches.Rectangle((field_borders+yds2px(96),bottom_coord_for_top_yardage_markers),yds2px(9),yardage_marker_height, facecolor='green'),
-                  }
+top_yardage_marker_labels = [ '10>', '20>', '30>', '40>', '50', '<40', '<30', '<20', '<10' ]
+top_yardage_markers = [ patches.Rectangle((x,bottom_coord_for_top_yardage_markers),yardage_marker_width,yardage_marker_height, facecolor='green') for x in yardage_marker_x_coords ]
+ax.add_collection(collections.PatchCollection(top_yardage_markers, match_original=True))
  
-for r in top_yardage_markers:
-    ax.add_artist(top_yardage_markers[r])
-    rx, ry = top_yardage_markers[r].get_xy()
-    cx = rx + top_yardage_markers[r].get_width()/2.0
-    cy = ry + top_yardage_markers[r].get_height()/2.0
-    ax.annotate(r, (cx, cy), color='w', weight='bold', 
-                fontsize=10, ha='center', va='center', rotation=180)
+cy = bottom_coord_for_top_yardage_markers + yardage_marker_height/2.0
+for (label,cx) in zip(top_yardage_marker_labels,yardage_marker_text_x_coords):
+    ax.text(cx, cy, label, color='w', fontproperties=yardage_marker_font, ha='center', va='center', rotation=180)
 
 
 # ---- Create drive boxes
 
 # Do home and road separately for now, so we can align text accordingly.
-home_team_drives = {}
-road_team_drives = {}
-dashed_quarter_lines = {}
-triangle_markers = {}
-home_team_drive_count = 0
-road_team_drive_count = 0
+# Each drive is stored as a tuple of (x, y, width, time at end of drive, drive). The result, details and comment
+# text are only built from the drive when the text is placed.
+home_team_drives = []
+road_team_drives = []
+dashed_quarter_lines = []
 y_coord_for_drive_box = field_height_with_borders - field_borders - yd_mrk_distance_from_border - yardage_marker_height - space_between_drive_boxes - height_of_drive_box
 
+# Offsets that are the same for every drive
+home_goal_line_x_coord = field_borders + yds2px(10) # borders + endzone, where the drive box yard lines are measured from
+home_ten_yard_line_x_coord = field_borders + yds2px(20) # borders + endzone + 10
+road_ten_yard_line_x_coord = field_borders + yds2px(100) # borders + endzone + 90
+dashed_quarter_line_width = field_width + (field_borders * 2) - 1
+
+# Calculate the position and width of all of the drive boxes at once, and convert them to pixels.
+# Only the y coordinates depend on the order of the drives and the quarter lines, so those are filled in by the loop below.
+drive_box_coords = get_all_dc_coords(drawn_drive_data,home_abbrev)
+drive_box_x_coords = home_goal_line_x_coord + yds2px(drive_box_coords[:,0])
+drive_box_widths = yds2px(drive_box_coords[:,1])
+drive_box_y_coords = np.zeros(len(drawn_drive_data))
+home_team_drive_mask = np.array([d.offensive_team == home_abbrev for d in drawn_drive_data], dtype=bool)
+lost_yards_mask = np.array([d.net_yards < 0 for d in drawn_drive_data], dtype=bool)
+
 this_quarter = 1
-for d in merged_drive_data:
-    if int(d.split(",")[4]) > 0:
-        quarter = int(d.split(",")[1])
-        start_time_of_drive = d.split(",")[2]
-        plays = int(d.split(",")[4])
-        length_in_time = d.split(",")[5]
-        net_yards = int(d.split(",")[6])
-        net_yards_as_string = get_net_yards_as_string(net_yards)
-        result_of_drive = d.split(",")[7]
-        optional_comment = d.split(",")[8]
-        offensive_team_abbrev = d.split(",")[9]
-        starting_yard_line = d.split(",")[11]
-        ending_yard_line = d.split(",")[12]
-        
-        (quarter_end_of_drive_as_string,time_end_of_drive_as_string) = get_end_of_drive_info(quarter,length_in_time,start_time_of_drive)
-        quarter_end_of_drive = int(quarter_end_of_drive_as_string)
-        
-        (left_coord,width_of_drive_box) = get_dc_coords(offensive_team_abbrev,home_abbrev,plays,net_yards,quarter_end_of_drive,length_in_time,start_time_of_drive,starting_yard_line,ending_yard_line,result_of_drive)
+for (n,d) in enumerate(drawn_drive_data):
+    (quarter_end_of_drive_as_string,time_end_of_drive_as_string) = get_end_of_drive_info(d.quarter,d.length,d.start_time)
+    quarter_end_of_drive = int(quarter_end_of_drive_as_string)
+    
 
-        # Draw a line between each quarter. These lines break up the chart into pieces that are organized by the quarter in which each drive ended.
-        if quarter_end_of_drive > this_quarter:
-            quarter_line_name = "Q" + "%d" % this_quarter
-            y_coord_for_drive_box += (height_of_drive_box + (space_between_drive_boxes/2))
-            dashed_quarter_lines[quarter_line_name] = patches.Rectangle((1, y_coord_for_drive_box), field_width + (field_borders * 2) - 1, 0, linestyle="--", edgecolor='black')
-            
-            # save the y_coord_for_drive_box in our global array that we use for locating the quarter labels
-            quarter_labels_y_offsets_GLOBAL.append(y_coord_for_drive_box)
-            
-            y_coord_for_drive_box -= (height_of_drive_box + (space_between_drive_boxes/2))
-            this_quarter = quarter_end_of_drive
+    # Draw a line between each quarter. These lines break up the chart into pieces that are organized by the quarter in which each drive ended.
+    if quarter_end_of_drive > this_quarter:
+        y_coord_for_drive_box += (height_of_drive_box + (space_between_drive_boxes/2))
+        dashed_quarter_lines.append(patches.Rectangle((1, y_coord_for_drive_box), dashed_quarter_line_width, 0, linestyle="--", edgecolor='black'))
         
-        # Note on "hatch" patterns that are used for drives that lose yards.
-        # Repeating the pattern more than once increases the density of the hatching.
-        # See: https://matplotlib.org/stable/api/_as_gen/matplotlib.patches.Patch.html#matplotlib.patches.Patch.set_hatch
+        # save the y_coord_for_drive_box in our global array that we use for locating the quarter labels
+        quarter_labels_y_offsets_GLOBAL.append(y_coord_for_drive_box)
         
-        if offensive_team_abbrev == home_abbrev:
-            drive_name = "home" + str(home_team_drive_count) + "_" + "%s" % (time_end_of_drive_as_string) + "_" + get_dc_result_abbrev(result_of_drive) + "_" + "%d-%s %s" % (plays,net_yards_as_string,length_in_time) + "_" + optional_comment
-            home_team_drive_count += 1
-            if net_yards < 0: # use hatch='///' in the patches.Rectangle call to denote drives that lose yards.
-                home_team_drives[drive_name] = patches.Rectangle((field_borders+yds2px(10)+yds2px(left_coord), y_coord_for_drive_box), yds2px(width_of_drive_box), height_of_drive_box, facecolor=home_team_primary_color, linewidth=2, edgecolor=home_team_secondary_color, hatch='////')
-            else:
-                home_team_drives[drive_name] = patches.Rectangle((field_borders+yds2px(10)+yds2px(left_coord), y_coord_for_drive_box), yds2px(width_of_drive_box), height_of_drive_box, facecolor=home_team_primary_color, linewidth=2, edgecolor=home_team_secondary_color)
-            
-            triangle_markers[drive_name] = patches.Polygon(get_triangle_coords("right",field_borders+yds2px(10+left_coord+width_of_drive_box),y_coord_for_drive_box,height_of_drive_box,width_of_drive_arrows), closed=True, facecolor=home_team_primary_color, linewidth=2, edgecolor=home_team_secondary_color)
-            
-            y_coord_for_drive_box -= (height_of_drive_box + space_between_drive_boxes)
-        else:
-            drive_name = "road" + str(road_team_drive_count) + "_" + "%s" % (time_end_of_drive_as_string) + "_" + get_dc_result_abbrev(result_of_drive) + "_" + "%d-%s %s" % (plays,net_yards_as_string,length_in_time) + "_" + optional_comment
-            road_team_drive_count += 1
-            if net_yards < 0: # use hatch='///' in the patches.Rectangle call to denote drives that lose yards.
-                road_team_drives[drive_name] = patches.Rectangle((field_borders+yds2px(10)+yds2px(left_coord), y_coord_for_drive_box), yds2px(width_of_drive_box), height_of_drive_box, facecolor=road_team_primary_color, linewidth=2, edgecolor=road_team_secondary_color, hatch='////')
-            else:
-                road_team_drives[drive_name] = patches.Rectangle((field_borders+yds2px(10)+yds2px(left_coord), y_coord_for_drive_box), yds2px(width_of_drive_box), height_of_drive_box, facecolor=road_team_primary_color, linewidth=2, edgecolor=road_team_secondary_color)
-
-            triangle_markers[drive_name] = patches.Polygon(get_triangle_coords("left",field_borders+yds2px(10+left_coord),y_coord_for_drive_box,height_of_drive_box,width_of_drive_arrows), closed=True, facecolor=road_team_primary_color, linewidth=2, edgecolor=road_team_secondary_color)
+        y_coord_for_drive_box -= (height_of_drive_box + (space_between_drive_boxes/2))
+        this_quarter = quarter_end_of_drive
+    
+    drive_box_y_coords[n] = y_coord_for_drive_box
+    drive_box = (drive_box_x_coords[n],y_coord_for_drive_box,drive_box_widths[n],time_end_of_drive_as_string,d)
 
-            y_coord_for_drive_box -= (height_of_drive_box + space_between_drive_boxes)
+    if d.offensive_team == home_abbrev:
+        home_team_drives.append(drive_box)
+    else:
+        road_team_drives.append(drive_box)
+
+    y_coord_for_drive_box -= (height_of_drive_box + space_between_drive_boxes)
+
+# Calculate the triangles for all of the drives in a single pass, so they can all be drawn as a single collection.
+# Home team triangles point right from the right-hand end of the drive box, road team triangles point left from the left-hand end.
+triangle_directions = np.where(home_team_drive_mask, "right", "left")
+triangle_box_x_coords = np.where(home_team_drive_mask, drive_box_x_coords + drive_box_widths, drive_box_x_coords)
+triangle_coords = get_triangle_coords(triangle_directions,triangle_box_x_coords,drive_box_y_coords,height_of_drive_box,width_of_drive_arrows)
+triangle_facecolors = np.where(home_team_drive_mask, home_team_colors.primary, road_team_colors.primary)
+triangle_edgecolors = np.where(home_team_drive_mask, home_team_colors.secondary, road_team_colors.secondary)
+triangle_markers = collections.PolyCollection(triangle_coords, closed=True, facecolors=triangle_facecolors, linewidths=2, edgecolors=triangle_edgecolors, joinstyle='miter')
+
+# Draw the drive boxes for each team as collections, built straight from the box coordinates rather than
+# from one Rectangle per drive. A collection can only use one hatch pattern, so the drives that lose yards
+# are picked out with a mask and drawn with hatch='////' in a separate collection.
+# Note on "hatch" patterns that are used for drives that lose yards.
+# Repeating the pattern more than once increases the density of the hatching.
+# See: https://matplotlib.org/stable/api/_as_gen/matplotlib.patches.Patch.html#matplotlib.patches.Patch.set_hatch
+drive_box_corners = get_box_coords(drive_box_x_coords,drive_box_y_coords,drive_box_widths,height_of_drive_box)
+for (team_mask,(primary_color,secondary_color)) in ((home_team_drive_mask,home_team_colors),(~home_team_drive_mask,road_team_colors)):
+    for (hatch,hatch_mask) in ((None,~lost_yards_mask),('////',lost_yards_mask)):
+        drive_boxes = drive_box_corners[team_mask & hatch_mask]
+        if len(drive_boxes) > 0:
+            ax.add_collection(collections.PolyCollection(drive_boxes, closed=True, facecolors=primary_color, linewidths=2, edgecolors=secondary_color, joinstyle='miter', hatch=hatch))
        
 # Text layout examples taken from:
 # https://matplotlib.org/stable/tutorials/text/text_props.html   
 
-for r in home_team_drives:
-    time_end_of_drive_abbrev = r.split("_")[1]
-    res_abbrev = r.split("_")[2]
-    details_abbrev = r.split("_")[3]
-    comment_abbrev = r.split("_")[4]
+for (rx,ry,box_width,time_end_of_drive_abbrev,d) in home_team_drives:
+    res_abbrev = get_dc_result_abbrev(d.result)
+    details_abbrev = get_dc_drive_details(d)
+    comment_abbrev = d.comment
     if len(comment_abbrev) > 0:
         comment_abbrev = comment_abbrev + ", "
     text_string_to_apply = "(" + details_abbrev + ") " + time_end_of_drive_abbrev + ", " + comment_abbrev + res_abbrev
-    ax.add_artist(home_team_drives[r])
-    rx, ry = home_team_drives[r].get_xy()
+    # The right-hand edge and vertical center of the drive box are used for every placement below
+    box_right = rx + box_width
+    cy = ry + 0.5*height_of_drive_box
     
-    if text_not_likely_to_fit_in_drive_box(home_team_drives[r].get_width(),len(text_string_to_apply)):
-#    if home_team_drives[r].get_width() < yds2px(25):
+    if text_not_likely_to_fit_in_drive_box(box_width,len(text_string_to_apply)):
+#    if box_width < yds2px(25):
          # place the text outside of the text box and use black as the text color
-        if rx < field_borders+yds2px(20): # borders + endzone + 10 == drives that start inside the home team's 10 yard line
+        if rx < home_ten_yard_line_x_coord: # drives that start inside the home team's 10 yard line
             # place text to the RIGHT of the drive box and the right-hand facing arrow
-            tmp = ax.text(rx+home_team_drives[r].get_width() + width_of_drive_arrows, 0.5*(ry+ry+home_team_drives[r].get_height()), text_string_to_apply, ha='left', va='center', color='black', weight='bold', fontsize=9)
+            tmp = ax.text(box_right + width_of_drive_arrows, cy, text_string_to_apply, ha='left', va='center', color='black', weight='bold', fontsize=9)
         else:
-            tmp = ax.text(rx, 0.5*(ry+ry+home_team_drives[r].get_height()), text_string_to_apply, ha='right', va='center', color='black', weight='bold', fontsize=9)
+            tmp = ax.text(rx, cy, text_string_to_apply, ha='right', va='center', color='black', weight='bold', fontsize=9)
     else:
         # place the text on top of the drive box, right-justified
-        tmp = ax.text(rx+home_team_drives[r].get_width(), 0.5*(ry+ry+home_team_drives[r].get_height()), text_string_to_apply, ha='right', va='center', color='white', weight='bold', fontsize=9)
+        tmp = ax.text(box_right, cy, text_string_to_apply, ha='right', va='center', color='white', weight='bold', fontsize=9)
     # text_box = tmp.get_window_extent(renderer=my_renderer)
     # TBD - this does not work. The width of the rectangle is given in different units than the text.
     # But even if we do this, we have to redraw the original box and text again.
-    # print("%s is %d wide, %d high (width of box is %d)" % (text_string_to_apply,text_box.width,text_box.height,home_team_drives[r].get_width()))
+    # print("%s is %d wide, %d high (width of box is %d)" % (text_string_to_apply,text_box.width,text_box.height,box_width))
     
-for r in road_team_drives:
-    time_end_of_drive_abbrev = r.split("_")[1]
-    res_abbrev = r.split("_")[2]
-    details_abbrev = r.split("_")[3]
-    comment_abbrev = r.split("_")[4]
+for (rx,ry,box_width,time_end_of_drive_abbrev,d) in road_team_drives:
+    res_abbrev = get_dc_result_abbrev(d.result)
+    details_abbrev = get_dc_drive_details(d)
+    comment_abbrev = d.comment
     if len(comment_abbrev) > 0:
         comment_abbrev = comment_abbrev + ", "
     text_string_to_apply =  res_abbrev + ", " + comment_abbrev + time_end_of_drive_abbrev + " (" + details_abbrev + ") "
-    ax.add_artist(road_team_drives[r])
-    rx, ry = road_team_drives[r].get_xy()
+    box_right = rx + box_width
+    cy = ry + 0.5*height_of_drive_box
     
-    if text_not_likely_to_fit_in_drive_box(road_team_drives[r].get_width(),len(text_string_to_apply)):
-#    if road_team_drives[r].get_width() < yds2px(25):
+    if text_not_likely_to_fit_in_drive_box(box_width,len(text_string_to_apply)):
+#    if box_width < yds2px(25):
          # place the text outside of the text box and use black as the text color
-        if rx+road_team_drives[r].get_width() > field_borders+yds2px(100): # borders + endzone + 90 == drives that start inside the road team's 10 yard line
+        if box_right > road_ten_yard_line_x_coord: # drives that start inside the road team's 10 yard line
             # place text to the LEFT of the drive box and the left-hand facing arrow
-            ax.text(rx-width_of_drive_arrows, 0.5*(ry+ry+road_team_drives[r].get_height()), text_string_to_apply, ha='right', va='center', color='black', weight='bold', fontsize=9)
+            ax.text(rx-width_of_drive_arrows, cy, text_string_to_apply, ha='right', va='center', color='black', weight='bold', fontsize=9)
         else:
             # place text to the right of the drive box
-            ax.text(rx+road_team_drives[r].get_width(), 0.5*(ry+ry+road_team_drives[r].get_height()), text_string_to_apply, ha='left', va='center', color='black', weight='bold', fontsize=9)
+            ax.text(box_right, cy, text_string_to_apply, ha='left', va='center', color='black', weight='bold', fontsize=9)
     else:
         # place the text on top of the drive box, left-justified
-        ax.text(rx, 0.5*(ry+ry+road_team_drives[r].get_height()), text_string_to_apply, ha='left', va='center', color='white', weight='bold', fontsize=9)
+        ax.text(rx, cy, text_string_to_apply, ha='left', va='center', color='white', weight='bold', fontsize=9)
 
 # The first quarter label will be located between the bottom of the field and the 
 # last quarter dashed line.
@@ -843,28 +811,28 @@ while n < (quarter_labels_count-1):
     quarter_labels_road_dictionary[get_quarter_label_text(n)] = patches.Rectangle((field_width_with_borders - field_borders,quarter_labels_y_offsets_GLOBAL[n+1]),field_borders/2,(quarter_labels_y_offsets_GLOBAL[n] - quarter_labels_y_offsets_GLOBAL[n+1]), facecolor='white')
     n = n+1
 
-for label in quarter_labels_home_dictionary:
-    ax.add_artist(quarter_labels_home_dictionary[label])
-    rx, ry = quarter_labels_home_dictionary[label].get_xy()
-    cx = rx + quarter_labels_home_dictionary[label].get_width()/2.0
-    cy = ry + quarter_labels_home_dictionary[label].get_height()/2.0
+# The label boxes for each margin are drawn as a single collection, with the text added on top of them.
+ax.add_collection(collections.PatchCollection(list(quarter_labels_home_dictionary.values()), match_original=True))
+for (label,r) in quarter_labels_home_dictionary.items():
+    rx, ry = r.get_xy()
+    cx = rx + r.get_width()/2.0
+    cy = ry + r.get_height()/2.0
     ax.annotate(label, (cx, cy), color='black', weight='bold', 
                 fontsize=10, ha='center', va='center', rotation=90) 
 
-for label in quarter_labels_road_dictionary:
-    ax.add_artist(quarter_labels_road_dictionary[label])
-    rx, ry = quarter_labels_road_dictionary[label].get_xy()
-    cx = rx + quarter_labels_road_dictionary[label].get_width()/2.5 # This is not a typo. I find that 270-degree rotated text tends to be rendered off-center (too far to the right) so I adjust the cx coord to shift it back to the left.
-    cy = ry + quarter_labels_road_dictionary[label].get_height()/2.0
+ax.add_collection(collections.PatchCollection(list(quarter_labels_road_dictionary.values()), match_original=True))
+for (label,r) in quarter_labels_road_dictionary.items():
+    rx, ry = r.get_xy()
+    cx = rx + r.get_width()/2.5 # This is not a typo. I find that 270-degree rotated text tends to be rendered off-center (too far to the right) so I adjust the cx coord to shift it back to the left.
+    cy = ry + r.get_height()/2.0
     ax.annotate(label, (cx, cy), color='black', weight='bold', 
                 fontsize=10, ha='center', va='center', rotation=270) 
 
     
 for q in dashed_quarter_lines:
-    ax.add_artist(dashed_quarter_lines[q])
+    ax.add_artist(q)
     
-for t in triangle_markers:
-    ax.add_artist(triangle_markers[t])
+ax.add_collection(triangle_markers)
 
 ax.set_axis_off() # Turning these off cleans up the plot
 